@@ -4,10 +4,16 @@ import time
 from dotenv import load_dotenv
 from google.adk.agents import SequentialAgent, LoopAgent
 from google.adk.agents.llm_agent import Agent
+from google.adk.models.google_llm import Gemini
 from google.genai import types
+from .callbacks import (
+    enforce_gemini_rate_limit,
+    reuse_github_tool_result,
+    store_github_tool_result,
+)
 from .custom_agent import GenerationRevisionAgent
-from .mcp import create_github_mcp_toolset, create_playwright_mcp_toolset
-from .prompts.prompt_parser import PROMPTS
+from .mcp import LazyToolset, create_github_mcp_toolset
+from .prompts.prompt_parser import INSTRUCTIONS
 from .tools import (
     # Route snapshots
     list_route_snapshots,
@@ -27,14 +33,27 @@ from .tools import (
 
 load_dotenv()  # Make variables from .env available for MCP configuration.
 
-github_toolset = create_github_mcp_toolset()
-playwright_toolset = create_playwright_mcp_toolset()
+# Shared Gemini model: transient 408/429/5xx responses are retried with
+# exponential backoff + jitter instead of aborting the whole run.
+gemini_model = Gemini(
+    model="gemini-2.5-flash",
+    retry_options=types.HttpRetryOptions(
+        attempts=5,
+        initial_delay=2.0,
+        max_delay=60.0,
+        exp_base=2.0,
+        jitter=1.0,
+    ),
+)
+
+# Snapshot readers shared by the junior and senior agents.
+SNAPSHOT_READ_TOOLS = (list_route_snapshots, load_route_snapshot)
 
 # ---------------------------------------------------------------------
 # Endpoint Discovery Agent
 # ---------------------------------------------------------------------
 endpoint_agent = Agent(
-    model="gemini-2.5-flash",
+    model=gemini_model,
     name="endpoint_agent",
     description=(
         """
@@ -45,16 +64,15 @@ endpoint_agent = Agent(
     generate_content_config=types.GenerateContentConfig(
         temperature=0.0,
     ),
-    instruction=(
-        PROMPTS["route_extraction"].prompt
-        + "\n\nReference the output format when structuring the response:\n\n"
-        + PROMPTS["route_extraction"].output_format
-    ),
+    instruction=INSTRUCTIONS["route_extraction"],
     tools=[
-        github_toolset, 
+        LazyToolset(create_github_mcp_toolset),
         store_routes_snapshot, 
         crawl_routes_snapshot
     ],
+    before_model_callback=enforce_gemini_rate_limit,
+    before_tool_callback=reuse_github_tool_result,
+    after_tool_callback=store_github_tool_result,
 )
 
 # -------------------------------------------------------------------
@@ -62,19 +80,15 @@ endpoint_agent = Agent(
 # -------------------------------------------------------------------
 
 junior_test_generation_agent = Agent(
-    model="gemini-2.5-flash",
+    model=gemini_model,
     name="junior_test_generation_agent",
     description="Generates initial Playwright API tests from stored route snapshots.",
-    instruction=(
-        PROMPTS["junior_test_generation"].prompt
-        + "\n\nReference the output format when structuring the response:\n\n"
-        + PROMPTS["junior_test_generation"].output_format
-    ),
+    instruction=INSTRUCTIONS["junior_test_generation"],
     tools=[
-        list_route_snapshots,
-        load_route_snapshot,
+        *SNAPSHOT_READ_TOOLS,
         store_playwright_tests,
     ],
+    before_model_callback=enforce_gemini_rate_limit,
 )
 
 # -------------------------------------------------------------------
@@ -82,22 +96,18 @@ junior_test_generation_agent = Agent(
 # -------------------------------------------------------------------
 
 senior_test_review_agent = Agent(
-    model="gemini-2.5-flash",
+    model=gemini_model,
     name="senior_test_review_agent",
     description="Reviews generated Playwright tests and approves or revises them.",
-    instruction=(
-        PROMPTS["senior_test_review"].prompt + 
-        "\n\nReference the output format when structuring the response:\n\n" 
-        + PROMPTS["senior_test_review"].output_format
-    ),
+    instruction=INSTRUCTIONS["senior_test_review"],
     tools=[
-        list_route_snapshots,
-        load_route_snapshot,
+        *SNAPSHOT_READ_TOOLS,
         list_playwright_tests,
         load_playwright_test,
         approve_generation,
         request_changes,
     ],
+    before_model_callback=enforce_gemini_rate_limit,
 )
 
 # -------------------------------------------------------------------
@@ -129,19 +139,16 @@ test_generation_loop = GenerationRevisionAgent(
 # Test Execution Agent
 # -------------------------------------------------------------------
 test_execution_agent = Agent(
-    model='gemini-2.5-flash',
+    model=gemini_model,
     name='test_execution_agent',
     description=(
         """
         Executes generated Playwright tests via the Playwright MCP HTTP server and reports results.
         """
     ),
-    instruction=(
-        PROMPTS["test_execution"].prompt
-        + "\n\nReference the output format when structuring the response:\n\n"
-        + PROMPTS["test_execution"].output_format
-    ),
+    instruction=INSTRUCTIONS["test_execution"],
     tools=[run_playwright_tests],
+    before_model_callback=enforce_gemini_rate_limit,
 )
 
 # -------------------------------------------------------------------
@@ -0,0 +1,185 @@
+"""ADK callbacks shared by the pipeline agents."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+import warnings
+from typing import Any, Dict, Optional, Tuple
+
+from cachetools import TTLCache
+
+
+class TokenBucket:
+    """Async token bucket: callers only wait when the bucket is empty."""
+
+    def __init__(self, *, capacity: float, period_seconds: float = 60.0):
+        self.capacity = capacity
+        self.rate = capacity / period_seconds
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, cost: float = 1.0) -> None:
+        # Reserve a slot under the lock (the balance may go negative), then
+        # sleep outside it so waiters neither hold the lock nor block the loop.
+        # A cost above capacity is clamped so oversized requests still run.
+        async with self._lock:
+            self._refill()
+            self._tokens -= min(cost, self.capacity)
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            await asyncio.sleep(wait)
+
+
+_gemini_buckets: Tuple[Optional[TokenBucket], Optional[TokenBucket]] = (None, None)
+_gemini_buckets_ready = False
+
+
+def _limit_from_env(name: str, default: str) -> float:
+    raw = os.getenv(name, default)
+    try:
+        return float(raw)
+    except ValueError:
+        # A typo should not fail every model call; keep the default instead.
+        warnings.warn(f"Ignoring invalid {name}={raw!r}; using the default of {default}.")
+        return float(default)
+
+
+def _get_gemini_buckets() -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+    # Resolved on first use so values loaded from `.env` after import apply.
+    global _gemini_buckets, _gemini_buckets_ready
+    if not _gemini_buckets_ready:
+        rpm = _limit_from_env("GEMINI_RPM", "10")
+        tpm = _limit_from_env("GEMINI_TPM", "250000")
+        _gemini_buckets = (
+            TokenBucket(capacity=rpm) if rpm > 0 else None,
+            TokenBucket(capacity=tpm) if tpm > 0 else None,
+        )
+        _gemini_buckets_ready = True
+    return _gemini_buckets
+
+
+def _estimate_tokens(llm_request: Any) -> int:
+    """Rough prompt size in tokens (~4 characters per token)."""
+    chars = 0
+    config = getattr(llm_request, "config", None)
+    system_instruction = getattr(config, "system_instruction", None)
+    if isinstance(system_instruction, str):
+        chars += len(system_instruction)
+    for content in getattr(llm_request, "contents", None) or []:
+        for part in content.parts or []:
+            if part.text:
+                chars += len(part.text)
+            elif part.function_response is not None:
+                chars += len(str(part.function_response.response))
+    return chars // 4
+
+
+async def enforce_gemini_rate_limit(callback_context: Any = None, llm_request: Any = None) -> None:
+    """`before_model_callback` that keeps Gemini calls under `GEMINI_RPM`/`GEMINI_TPM`.
+
+    Each call takes one request slot and its estimated prompt tokens, so a
+    large prompt waits for token budget without stalling small ones behind
+    a fixed delay. Returning None lets ADK proceed with the model call.
+    Set either variable to 0 to disable that limit (e.g. on a paid quota).
+    """
+    requests_bucket, tokens_bucket = _get_gemini_buckets()
+    if requests_bucket is not None:
+        await requests_bucket.acquire()
+    if tokens_bucket is not None:
+        await tokens_bucket.acquire(_estimate_tokens(llm_request))
+    return None
+
+
+# Read-only GitHub MCP tools whose results can be reused within one run.
+CACHEABLE_GITHUB_TOOLS = frozenset(
+    f"GITHUB_{name}"
+    for name in (
+        "get_file_contents",
+        "search_code",
+        "search_repositories",
+        "list_commits",
+        "list_issues",
+        "get_issue",
+        "list_pull_requests",
+        "get_pull_request",
+        "get_pull_request_files",
+    )
+)
+
+_github_tool_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+# Calls currently running, keyed like the cache. ADK runs a turn's function
+# calls concurrently, so identical calls would otherwise all miss the cache.
+_github_tool_inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+
+
+def _github_cache_key(tool: Any, args: Dict[str, Any], tool_context: Any) -> Optional[Tuple[str, str, str]]:
+    if tool.name not in CACHEABLE_GITHUB_TOOLS:
+        return None
+    canonical_args = json.dumps(args, sort_keys=True, default=str)
+    return (tool_context.invocation_id, tool.name, canonical_args)
+
+
+def _settle_inflight(key: Tuple[str, str, str], result: Any) -> None:
+    future = _github_tool_inflight.pop(key, None)
+    if future is not None and not future.done():
+        future.set_result(result)
+
+
+async def reuse_github_tool_result(tool: Any, args: Dict[str, Any], tool_context: Any) -> Optional[Any]:
+    """`before_tool_callback` returning a cached result for repeated GitHub reads.
+
+    Scoped to the current invocation, so a new run always sees fresh data.
+    Identical calls made while one is running wait for its result; if it
+    fails, they run the tool themselves.
+    """
+    key = _github_cache_key(tool, args, tool_context)
+    if key is None:
+        return None
+    cached = _github_tool_cache.get(key)
+    if cached is not None:
+        return cached
+    pending = _github_tool_inflight.get(key)
+    if pending is not None:
+        # Shield so a cancelled waiter does not cancel the shared future
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _github_tool_inflight[key] = future
+
+    def release(_task: asyncio.Task) -> None:
+        if _github_tool_inflight.get(key) is future:
+            _settle_inflight(key, None)
+
+    # after_tool_callback is skipped when the tool raises, so also release
+    # waiters when this call's task ends, however it ends.
+    asyncio.current_task().add_done_callback(release)
+    return None
+
+
+def store_github_tool_result(
+    tool: Any, args: Dict[str, Any], tool_context: Any, tool_response: Any
+) -> None:
+    """`after_tool_callback` recording GitHub read results for reuse."""
+    key = _github_cache_key(tool, args, tool_context)
+    if key is None:
+        return None
+    # MCP tools return a CallToolResult; plain function tools return dicts.
+    if isinstance(tool_response, dict):
+        is_error = tool_response.get("isError", False)
+    else:
+        is_error = getattr(tool_response, "isError", False)
+    if tool_response is None or is_error:
+        _settle_inflight(key, None)
+        return None
+    _github_tool_cache[key] = tool_response
+    _settle_inflight(key, tool_response)
+    return None
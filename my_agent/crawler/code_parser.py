@@ -6,8 +6,10 @@ import ast
 import json
 import hashlib
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, asdict, field
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -25,7 +27,11 @@ class HTTPMethod(str, Enum):
     OPTIONS = "OPTIONS"
 
 
-@dataclass
+# Built once; parsers look methods up per decorator/route
+_HTTP_METHODS: Dict[str, HTTPMethod] = {m.name: m for m in HTTPMethod}
+
+
+@dataclass(slots=True)
 class Parameter:
     """Represents a route parameter."""
     name: str
@@ -34,10 +40,16 @@ class Parameter:
     description: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Built directly: asdict() recurses and deep-copies every field
+        return {
+            "name": self.name,
+            "type_hint": self.type_hint,
+            "required": self.required,
+            "description": self.description,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class Route:
     """Represents an extracted API route."""
     path: str
@@ -68,13 +80,173 @@ class Route:
         }
 
 
-class FastAPIParser(ast.NodeVisitor):
+def _fast_unparse(node: ast.expr) -> Optional[str]:
+    """Render common annotation shapes directly; None means use ast.unparse.
+    
+    Covers names, dotted names, subscripts like Optional[str] or
+    Dict[str, int], None and PEP 604 unions, matching ast.unparse output.
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _fast_unparse(node.value)
+        return f"{value}.{node.attr}" if value is not None else None
+    if isinstance(node, ast.Subscript):
+        value = _fast_unparse(node.value)
+        if value is None:
+            return None
+        if isinstance(node.slice, ast.Tuple) and node.slice.elts:
+            items = [_fast_unparse(elt) for elt in node.slice.elts]
+            if None in items:
+                return None
+            inner = ", ".join(items)
+        else:
+            inner = _fast_unparse(node.slice)
+            if inner is None:
+                return None
+        return f"{value}[{inner}]"
+    if isinstance(node, ast.Constant) and node.value is None:
+        return "None"
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        if isinstance(node.right, ast.BinOp):
+            return None  # right-nested unions need parentheses
+        left = _fast_unparse(node.left)
+        right = _fast_unparse(node.right)
+        if left is None or right is None:
+            return None
+        return f"{left} | {right}"
+    return None
+
+
+def _annotation_str(annotation: Optional[ast.expr]) -> Optional[str]:
+    """Render a type annotation, interned since the same few hints repeat.
+    
+    Identifiers from ast.parse are already interned; unparsed annotations
+    are fresh strings, and shared ones also pickle once per worker batch.
+    """
+    if annotation is None:
+        return None
+    text = _fast_unparse(annotation)
+    return sys.intern(text if text is not None else ast.unparse(annotation))
+
+
+class _AuthScan(ast.NodeVisitor):
+    """Finds auth-related identifiers or strings without unparsing the tree."""
+    
+    AUTH_MARKERS = ("auth", "security")
+    
+    def __init__(self):
+        self.found = False
+    
+    def _check(self, text: Optional[str]) -> None:
+        if text and not self.found:
+            lowered = text.lower()
+            self.found = any(marker in lowered for marker in self.AUTH_MARKERS)
+    
+    def _check_then_visit(self, node: ast.AST, *names: Optional[str]) -> None:
+        for name in names:
+            self._check(name)
+        if not self.found:
+            self.generic_visit(node)
+    
+    def visit(self, node: ast.AST) -> None:
+        if self.found:
+            return
+        super().visit(node)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            if self.found:
+                return
+            self.visit(child)
+    
+    def visit_Name(self, node: ast.Name) -> None:
+        self._check(node.id)
+    
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        self._check(node.attr)
+        if not self.found:
+            self.visit(node.value)
+    
+    def visit_arg(self, node: ast.arg) -> None:
+        self._check(node.arg)
+        if not self.found:
+            self.generic_visit(node)
+    
+    def visit_keyword(self, node: ast.keyword) -> None:
+        self._check(node.arg)
+        if not self.found:
+            self.visit(node.value)
+    
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if isinstance(node.value, str):
+            self._check(node.value)
+        elif isinstance(node.value, bytes):
+            self._check(node.value.decode("latin-1"))
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._check_then_visit(node, node.name)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._check_then_visit(node, node.name)
+    
+    # Remaining names that appear in source but are not Name nodes
+    def visit_alias(self, node: ast.alias) -> None:
+        self._check(node.name)
+        self._check(node.asname)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self._check_then_visit(node, node.module)
+    
+    def visit_Global(self, node: ast.Global) -> None:
+        for name in node.names:
+            self._check(name)
+    
+    visit_Nonlocal = visit_Global
+    
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        self._check_then_visit(node, node.name)
+    
+    def visit_MatchAs(self, node: ast.MatchAs) -> None:
+        self._check_then_visit(node, node.name)
+    
+    def visit_MatchStar(self, node: ast.MatchStar) -> None:
+        self._check(node.name)
+    
+    def visit_MatchMapping(self, node: ast.MatchMapping) -> None:
+        self._check_then_visit(node, node.rest)
+    
+    def visit_MatchClass(self, node: ast.MatchClass) -> None:
+        self._check_then_visit(node, *node.kwd_attrs)
+    
+    # PEP 695 type parameters (Python 3.12+)
+    def visit_TypeVar(self, node: ast.AST) -> None:
+        self._check_then_visit(node, node.name)
+    
+    visit_ParamSpec = visit_TypeVarTuple = visit_TypeVar
+
+
+class _StatementVisitor(ast.NodeVisitor):
+    """NodeVisitor that only descends into statements.
+    
+    Route decorators sit on function definitions, which are statements, so
+    expressions (usually most of a handler's nodes) are never walked.
+    """
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                self.visit(child)
+
+
+class FastAPIParser(_StatementVisitor):
     """Efficient FastAPI route extractor using AST."""
     
     def __init__(self, file_path: str):
         self.file_path = file_path
         self.routes: List[Route] = []
-        self.methods_cache = {m.name: m for m in HTTPMethod}
     
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Visit function definitions for route decorators."""
@@ -84,13 +256,15 @@ class FastAPIParser(ast.NodeVisitor):
                 self.routes.append(route)
         self.generic_visit(node)
     
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
     def _extract_from_decorator(self, dec: ast.expr, func: ast.FunctionDef) -> Optional[Route]:
         """Extract route from @app.method(path) decorator."""
         if not isinstance(dec, ast.Call) or not isinstance(dec.func, ast.Attribute):
             return None
         
         method = dec.func.attr.upper()
-        if method not in self.methods_cache:
+        if method not in _HTTP_METHODS:
             return None
         
         if not dec.args or not isinstance(dec.args[0], ast.Constant):
@@ -105,7 +279,7 @@ class FastAPIParser(ast.NodeVisitor):
         
         return Route(
             path=path,
-            methods=[self.methods_cache[method]],
+            methods=[_HTTP_METHODS[method]],
             handler_name=func.name,
             file_path=self.file_path,
             line_number=func.lineno,
@@ -123,7 +297,7 @@ class FastAPIParser(ast.NodeVisitor):
         for arg in func.args.args:
             if arg.arg in skip:
                 continue
-            type_hint = ast.unparse(arg.annotation) if arg.annotation else None
+            type_hint = _annotation_str(arg.annotation)
             params.append(Parameter(name=arg.arg, type_hint=type_hint))
         
         return params
@@ -134,17 +308,17 @@ class FastAPIParser(ast.NodeVisitor):
             if keyword.arg == "dependencies":
                 return True
         
-        func_str = ast.unparse(func).lower()
-        return "auth" in func_str or "security" in func_str
+        scan = _AuthScan()
+        scan.visit(func)
+        return scan.found
 
 
-class FlaskParser(ast.NodeVisitor):
+class FlaskParser(_StatementVisitor):
     """Efficient Flask route extractor using AST."""
     
     def __init__(self, file_path: str):
         self.file_path = file_path
         self.routes: List[Route] = []
-        self.methods_cache = {m.name: m for m in HTTPMethod}
     
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Visit function definitions for @app.route decorators."""
@@ -154,6 +328,8 @@ class FlaskParser(ast.NodeVisitor):
                 self.routes.append(route)
         self.generic_visit(node)
     
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
     def _extract_from_decorator(self, dec: ast.expr, func: ast.FunctionDef) -> Optional[Route]:
         """Extract route from @app.route(path, methods=[...]) decorator."""
         if not isinstance(dec, ast.Call) or not isinstance(dec.func, ast.Attribute):
@@ -193,8 +369,8 @@ class FlaskParser(ast.NodeVisitor):
                 for elt in kw.value.elts:
                     if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
                         m = elt.value.upper()
-                        if m in self.methods_cache:
-                            extracted.append(self.methods_cache[m])
+                        if m in _HTTP_METHODS:
+                            extracted.append(_HTTP_METHODS[m])
                 if extracted:
                     methods = extracted
         
@@ -207,7 +383,7 @@ class FlaskParser(ast.NodeVisitor):
         
         for arg in func.args.args:
             if arg.arg not in skip:
-                type_hint = ast.unparse(arg.annotation) if arg.annotation else None
+                type_hint = _annotation_str(arg.annotation)
                 params.append(Parameter(name=arg.arg, type_hint=type_hint))
         
         return params
@@ -216,13 +392,13 @@ class FlaskParser(ast.NodeVisitor):
 class ExpressParser:
     """Efficient regex-based Express.js route extractor."""
     
-    # Compiled patterns for performance
-    ROUTE_PATTERNS = [
-        re.compile(r"app\.(get|post|put|delete|patch|head|options)\s*\(\s*['\"]([^'\"]+)['\"]"),
-        re.compile(r"router\.(get|post|put|delete|patch|head|options)\s*\(\s*['\"]([^'\"]+)['\"]"),
-    ]
+    # Route calls are found by locating these prefixes with str.find and only
+    # then matching the verb and path, instead of regex-scanning every offset
+    ROUTE_PREFIXES = ("app.", "router.")
+    ROUTE_CALL = re.compile(r"(get|post|put|delete|patch|head|options)\s*\(\s*['\"]([^'\"]+)['\"]")
     
     AUTH_PATTERN = re.compile(r"(auth|protect|login|jwt|token|verify)", re.IGNORECASE)
+    AUTH_WINDOW = 200
     
     def __init__(self, file_path: str):
         self.file_path = file_path
@@ -230,21 +406,42 @@ class ExpressParser:
     
     def parse(self, content: str) -> List[Route]:
         """Extract routes from content efficiently."""
-        for pattern in self.ROUTE_PATTERNS:
-            for match in pattern.finditer(content):
-                method = match.group(1).upper()
-                path = match.group(2)
-                
-                if method in HTTPMethod.__members__:
-                    auth = bool(self.AUTH_PATTERN.search(content[max(0, match.start()-200):match.end()]))
-                    self.routes.append(Route(
-                        path=path,
-                        methods=[HTTPMethod[method]],
-                        file_path=self.file_path,
-                        auth_required=auth,
-                    ))
+        for start, match in self._iter_route_calls(content):
+            method = match.group(1).upper()
+            path = match.group(2)
+            
+            if method in _HTTP_METHODS:
+                # pos/endpos search the window without slicing out a copy
+                auth = bool(self.AUTH_PATTERN.search(
+                    content, max(0, start - self.AUTH_WINDOW), match.end()
+                ))
+                self.routes.append(Route(
+                    path=path,
+                    methods=[_HTTP_METHODS[method]],
+                    file_path=self.file_path,
+                    auth_required=auth,
+                ))
         
         return self.routes
+    
+    def _iter_route_calls(self, content: str):
+        """Yield (start, match) for each app./router. route call in source order."""
+        next_at = {prefix: content.find(prefix) for prefix in self.ROUTE_PREFIXES}
+        pos = 0
+        while True:
+            for prefix, found in next_at.items():
+                if found != -1 and found < pos:
+                    next_at[prefix] = content.find(prefix, pos)
+            candidates = [(found, prefix) for prefix, found in next_at.items() if found != -1]
+            if not candidates:
+                return
+            start, prefix = min(candidates)
+            match = self.ROUTE_CALL.match(content, start + len(prefix))
+            if match:
+                yield start, match
+                pos = match.end()
+            else:
+                pos = start + 1
 
 
 # Efficient file filtering with compile-once patterns
@@ -261,32 +458,39 @@ PRIORITY_PATTERNS = {
     ".js": ("routes", "controllers", "handlers", "api"),
 }
 
+# Any skipped directory or dot-prefixed part (other than ".") in the path
+_SKIP_RE = re.compile(
+    r"(?:^|[\\/])(?:(?:%s)(?:[\\/]|$)|\.(?![\\/]|$))"
+    % "|".join(sorted(map(re.escape, SKIP_DIRS)))
+)
+_SUFFIX_RE = re.compile(r"[^\\/]\.[^\\/.]*$")
+_PRIORITY_RE = {
+    suffix: re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+    for suffix, keywords in PRIORITY_PATTERNS.items()
+}
+
 
 def should_scan_file(file_path: str) -> bool:
     """Determine if file should be scanned (fast-path filtering)."""
-    path = Path(file_path)
-    
-    # Quick directory skip
-    for part in path.parts:
-        if part in SKIP_DIRS or (part.startswith(".") and part != "."):
-            return False
-    
-    # Check file extension and path keywords
-    suffix = path.suffix
-    if suffix in PRIORITY_PATTERNS:
-        keywords = PRIORITY_PATTERNS[suffix]
-        path_lower = str(path).lower()
-        return any(kw in path_lower for kw in keywords)
-    
-    return False
+    # Check file extension first: most files in a repo are not source files
+    match = _SUFFIX_RE.search(file_path)
+    keywords = _PRIORITY_RE.get(match.group()[1:]) if match else None
+    if keywords is None:
+        return False
+    
+    # Quick directory skip, then path keywords
+    if _SKIP_RE.search(file_path):
+        return False
+    return keywords.search(file_path) is not None
 
 
-def _hash_content(content: str) -> str:
-    """Fast content hash for change detection."""
-    return hashlib.md5(content.encode()).hexdigest()
+def _hash_content(content: str | bytes) -> str:
+    """Fast content hash for change detection (64-bit BLAKE2b, hex)."""
+    data = content.encode() if isinstance(content, str) else content
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """Result of parsing a single file."""
     file_path: str
@@ -308,6 +512,9 @@ def parse_file_with_framework(
     
     try:
         if file_path.endswith(".py"):
+            # Both Python parsers only read decorators; no "@" means no routes
+            if "@" not in content:
+                return None
             if not detected_fw:
                 detected_fw = "fastapi" if "fastapi" in content.lower() else "flask"
             
@@ -338,26 +545,75 @@ def parse_file_with_framework(
 
 
 class RouteCacheManager:
-    """Efficient caching for parsed routes with incremental updates."""
+    """Efficient caching for parsed routes with incremental updates.
+    
+    Hashes live in a JSON snapshot plus an append-only log of changes since
+    it was written, so a scan touching a few files appends a few lines
+    instead of rewriting the whole snapshot. The log is folded back into the
+    snapshot once it outgrows a quarter of the snapshot's size.
+    """
+    
+    COMPACT_RATIO = 4
     
     def __init__(self, cache_dir: str = ".api-tests/.route-cache"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "file_hashes.json"
+        self.log_file = self.cache_dir / "file_hashes.log"
         self.hashes: Dict[str, str] = self._load_hashes()
+        self._pending: Dict[str, Optional[str]] = {}
     
     def _load_hashes(self) -> Dict[str, str]:
-        """Load cached file hashes."""
+        """Load cached file hashes: snapshot first, then replay the log."""
+        hashes: Dict[str, str] = {}
         if self.cache_file.exists():
             try:
-                return json.loads(self.cache_file.read_text())
+                data = self.cache_file.read_bytes()
+                hashes = json.loads(data) if data else {}
             except (json.JSONDecodeError, IOError):
                 pass
-        return {}
+        
+        if self.log_file.exists():
+            try:
+                lines = self.log_file.read_bytes().splitlines()
+            except IOError:
+                lines = []
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn write from an interrupted run
+                if entry["h"] is None:
+                    hashes.pop(entry["p"], None)
+                else:
+                    hashes[entry["p"]] = entry["h"]
+        
+        return hashes
     
     def save_hashes(self) -> None:
-        """Save file hashes for next run."""
-        self.cache_file.write_text(json.dumps(self.hashes, indent=2))
+        """Append this run's changes to the log, compacting when it grows."""
+        if not self._pending and self.cache_file.exists():
+            return
+        
+        if self._pending:
+            data = "".join(
+                json.dumps({"p": path, "h": file_hash}, separators=(",", ":")) + "\n"
+                for path, file_hash in self._pending.items()
+            ).encode("utf-8")
+            with open(self.log_file, "ab") as log:
+                log.write(data)
+            self._pending.clear()
+        
+        snapshot_size = self.cache_file.stat().st_size if self.cache_file.exists() else 0
+        log_size = self.log_file.stat().st_size if self.log_file.exists() else 0
+        if not self.cache_file.exists() or log_size * self.COMPACT_RATIO > snapshot_size:
+            self._compact()
+    
+    def _compact(self) -> None:
+        """Write the full snapshot (compact, single line) and empty the log."""
+        data = json.dumps(self.hashes, separators=(",", ":"))
+        self.cache_file.write_bytes(data.encode("utf-8"))
+        self.log_file.write_bytes(b"")
     
     def get_changed_files(self, files: Dict[str, str]) -> Dict[str, str]:
         """Return only files that changed since last parse."""
@@ -370,6 +626,7 @@ class RouteCacheManager:
             if new_hash != old_hash:
                 changed[file_path] = content
                 self.hashes[file_path] = new_hash
+                self._pending[file_path] = new_hash
         
         return changed
     
@@ -378,6 +635,11 @@ class RouteCacheManager:
         to_remove = set(self.hashes.keys()) - current_files
         for f in to_remove:
             del self.hashes[f]
+            self._pending[f] = None
+
+
+# Below this many files, parsing inline beats starting a worker pool
+INLINE_PARSE_THRESHOLD = 8
 
 
 def extract_routes_parallel(
@@ -411,18 +673,35 @@ def extract_routes_parallel(
     frameworks = {}
     start = time.time()
     
-    # Parallel parsing
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(parse_file_with_framework, fp, content, framework): fp
-            for fp, content in files.items()
-        }
-        
-        for future in as_completed(futures):
-            result = future.result()
-            if result:
-                all_routes.extend(result.routes)
-                frameworks[result.file_path] = result.framework
+    # Drop files a worker would reject anyway (empty, skipped paths) before dispatch
+    candidates = {
+        fp: content for fp, content in files.items()
+        if content and not content.isspace() and should_scan_file(fp)
+    }
+    
+    # Parsing is pure Python, so worker threads only overlap on free-threaded
+    # builds; under the GIL they take turns, and small batches skip the pool.
+    if len(candidates) < INLINE_PARSE_THRESHOLD:
+        results = [
+            parse_file_with_framework(fp, content, framework)
+            for fp, content in candidates.items()
+        ]
+    else:
+        # Largest files first, so a big file is not left for last
+        # while the other workers sit idle
+        paths = sorted(candidates, key=lambda fp: len(candidates[fp]), reverse=True)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                parse_file_with_framework, paths, map(candidates.get, paths), repeat(framework)
+            ))
+    parsed = {result.file_path: result for result in results if result}
+    
+    # Report routes in input order regardless of dispatch order
+    for fp in candidates:
+        result = parsed.get(fp)
+        if result:
+            all_routes.extend(result.routes)
+            frameworks[fp] = result.framework
     
     # Save cache and return
     if cache_mgr:
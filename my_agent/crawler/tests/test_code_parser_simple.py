@@ -4,9 +4,11 @@ Run: python -m pytest test_code_parser_simple.py -v
 Or directly: python test_code_parser_simple.py
 """
 
+import asyncio
 import json
 import time
 import tempfile
+import warnings
 from pathlib import Path
 import ast
 import sys
@@ -172,6 +174,60 @@ def admin_panel():
         assert_len(parser.routes, 1)
         assert_true(parser.routes[0].auth_required, "Should detect auth requirement")
     
+    @staticmethod
+    def test_03b_auth_from_handler_body():
+        """Test auth detected from handler names, not only decorator dependencies."""
+        code = '''
+from fastapi import FastAPI, Security
+
+app = FastAPI()
+
+@app.get("/me")
+def read_me(token: str = Security(oauth2_scheme)):
+    return {}
+
+@app.get("/public")
+def read_public(limit: int = 10):
+    return {}
+
+@app.get("/admin")
+def read_admin():
+    from mylib import require_auth as guard
+    return guard()
+'''
+        parser = FastAPIParser("test.py")
+        parser.visit(ast.parse(code))
+        
+        assert_len(parser.routes, 3)
+        assert_true(parser.routes[0].auth_required, "Security() should mark auth")
+        assert_true(not parser.routes[1].auth_required, "Public route has no auth")
+        assert_true(parser.routes[2].auth_required, "Local auth import should mark auth")
+    
+    @staticmethod
+    def test_03c_async_and_nested_routes():
+        """Test async handlers and routes registered inside a factory function."""
+        code = '''
+from fastapi import FastAPI
+
+app = FastAPI()
+
+@app.get("/async")
+async def read_async():
+    return {}
+
+def register(router):
+    @router.post("/nested")
+    async def create_nested(name: str):
+        return {}
+'''
+        parser = FastAPIParser("test.py")
+        parser.visit(ast.parse(code))
+        
+        assert_len(parser.routes, 2)
+        assert_equal(parser.routes[0].handler_name, "read_async")
+        assert_equal(parser.routes[1].path, "/nested")
+        assert_in(HTTPMethod.POST, parser.routes[1].methods)
+    
     @staticmethod
     def test_04_multiple_routes():
         """Test file with multiple routes."""
@@ -510,6 +566,12 @@ class TestContentHashing:
         hash1 = _hash_content("def func():\n  pass")
         hash2 = _hash_content("def func():\npass")
         assert_true(hash1 != hash2, "Whitespace changes should affect hash")
+    
+    @staticmethod
+    def test_04_bytes_match_str():
+        """Bytes input should hash the same as its decoded text."""
+        content = "def handler(): return 'é'"
+        assert_equal(_hash_content(content.encode()), _hash_content(content))
 
 
 # ============================================================================
@@ -579,6 +641,28 @@ class TestCacheManager:
             
             assert_true("file1.py" in cache.hashes)
             assert_true("file2.py" not in cache.hashes, "Stale file should be removed")
+    
+    @staticmethod
+    def test_06_persists_incremental_updates():
+        """Test hashes saved via the change log reload in a new manager."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = {f"file{i}.py": f"code{i}" for i in range(50)}
+            cache = RouteCacheManager(tmpdir)
+            cache.get_changed_files(files)
+            cache.save_hashes()
+            
+            # Small follow-up run: one edit and one deletion
+            cache = RouteCacheManager(tmpdir)
+            files["file1.py"] = "code1 changed"
+            del files["file2.py"]
+            cache.get_changed_files(files)
+            cache.remove_stale(set(files))
+            cache.save_hashes()
+            assert_true(cache.log_file.stat().st_size > 0, "Small update should append to the log")
+            
+            reloaded = RouteCacheManager(tmpdir)
+            assert_equal(reloaded.hashes, cache.hashes)
+            assert_len(reloaded.get_changed_files(files), 0, "Reloaded hashes should match")
 
 
 # ============================================================================
@@ -666,6 +750,35 @@ def users():
         )
         
         assert_equal(len(routes), 0, "Should handle empty files gracefully")
+    
+    @staticmethod
+    def test_05_extract_from_worker_thread():
+        """Test extraction via asyncio.to_thread, as the crawl tool runs it."""
+        files = {
+            f"routes/api_{i}.py": f'''
+from fastapi import FastAPI
+app = FastAPI()
+
+@app.get("/route{i}")
+def handler_{i}():
+    return {{"id": {i}}}
+'''
+            for i in range(code_parser.INLINE_PARSE_THRESHOLD * 2)
+        }
+        
+        async def crawl():
+            return await asyncio.to_thread(
+                extract_routes_parallel, files, framework="fastapi", use_cache=False, max_workers=2
+            )
+        
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            routes, metadata = asyncio.run(crawl())
+        
+        assert_len(routes, len(files), "Should extract every route from a worker thread")
+        assert_equal(metadata["status"], "success")
+        fork_warnings = [w for w in caught if "fork" in str(w.message)]
+        assert_equal(fork_warnings, [], "Should not fork a multi-threaded process")
 
 
 # ============================================================================
@@ -799,11 +912,11 @@ def handler_{i}(skip: int = 0, limit: int = 10):
         ] * 100
         
         start = time.perf_counter()
-        for path in paths:
-            should_scan_file(path)
+        accepted = list(filter(should_scan_file, paths))
         duration = (time.perf_counter() - start) * 1000
         
         print(f"    File filtering ({len(paths)} paths): {duration:.2f}ms")
+        assert_len(accepted, 200, "Only the routes/controllers paths should pass")
         assert_true(duration < 100, "File filtering should be fast (<100ms)")
 
 
@@ -6,6 +6,9 @@ from pathlib import Path
 from typing import AsyncIterator
 from pydantic import PrivateAttr
 
+# Event fields supported by the installed ADK version, resolved once
+_EVENT_FIELDS = frozenset(getattr(Event, "model_fields", None) or ())
+
 class GenerationRevisionAgent(BaseAgent):
     _junior_agent: BaseAgent = PrivateAttr()
     _senior_agent: BaseAgent = PrivateAttr()
@@ -45,15 +48,15 @@ class GenerationRevisionAgent(BaseAgent):
             kwargs["turn_complete"] = turn_complete
 
         # Guard against version differences (only pass supported fields)
-        model_fields = getattr(Event, "model_fields", None)
-        if model_fields:
-            kwargs = {k: v for k, v in kwargs.items() if k in model_fields}
+        if _EVENT_FIELDS:
+            kwargs = {k: v for k, v in kwargs.items() if k in _EVENT_FIELDS}
 
         return Event(**kwargs)
 
     async def run_async(self, invocation_context) -> AsyncIterator[Event]:
         """
-        Repeatedly runs junior + senior until all services are approved
+        Repeatedly runs junior + senior until all services are approved,
+        the senior has decided on every service without requesting changes,
         or max_iterations is reached.
         """
 
@@ -66,8 +69,18 @@ class GenerationRevisionAgent(BaseAgent):
             async for event in self._junior_agent.run_async(invocation_context):
                 yield event
 
-            # --- Run senior agent ---
+            # --- Run senior agent, noting its decisions ---
+            changes_requested = False
+            decided: set[str] = set()
             async for event in self._senior_agent.run_async(invocation_context):
+                for call in event.get_function_calls():
+                    if call.name not in ("approve_generation", "request_changes"):
+                        continue
+                    if call.name == "request_changes":
+                        changes_requested = True
+                    service = (call.args or {}).get("service")
+                    if service is not None:
+                        decided.add(service)
                 yield event
 
             # --- Check stopping condition ---
@@ -75,6 +88,15 @@ class GenerationRevisionAgent(BaseAgent):
                 yield self._make_text_event(author=self.name, text="All services approved. Stopping test generation loop.")
                 break
 
+            # Without requested changes the junior has no feedback to act on,
+            # but services not yet generated or reviewed need another round.
+            # Stop only once every expected service is approved or decided.
+            if not changes_requested and (
+                self._expected_services() <= self._approved_services() | decided
+            ):
+                yield self._make_text_event(author=self.name, text="No changes requested. Stopping test generation loop.")
+                break
+
         # --- Final log ---
         yield self._make_text_event(author=self.name, text="Test generation loop completed.")
 
@@ -83,16 +105,19 @@ class GenerationRevisionAgent(BaseAgent):
         if not state_dir.exists():
             return False
 
-        approved_services = {
+        return self._expected_services().issubset(self._approved_services())
+
+    def _approved_services(self) -> set[str]:
+        state_dir = Path(".api-tests/.atlas-internal")
+        return {
             p.stem.replace(".approved", "")
             for p in state_dir.glob("*.approved.json")
         }
 
+    def _expected_services(self) -> set[str]:
         # Derive expected services from route snapshots
         routes_dir = Path(".api-tests/routes")
-        expected_services = {
+        return {
             p.stem.replace("-routes", "")
             for p in routes_dir.glob("*-routes.json")
         }
-
-        return expected_services.issubset(approved_services)
@@ -4,6 +4,7 @@ from .github import (
     GithubMcpConfigError,
     create_github_mcp_toolset,
 )
+from .lazy import LazyToolset
 from .playwright import (
     PlaywrightMcpConfigError,
     create_playwright_mcp_toolset,
@@ -11,6 +12,7 @@ from .playwright import (
 
 __all__ = [
     "GithubMcpConfigError",
+    "LazyToolset",
     "PlaywrightMcpConfigError",
     "create_github_mcp_toolset",
     "create_playwright_mcp_toolset",
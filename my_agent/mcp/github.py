@@ -9,6 +9,8 @@ from typing import Dict, List
 from google.adk.tools.mcp_tool import McpToolset, StdioConnectionParams
 from mcp import StdioServerParameters
 
+from .retry import RetryingMcpToolset
+
 DEFAULT_COMMAND = "npx"
 DEFAULT_ARGS: List[str] = ["-y", "@modelcontextprotocol/server-github"]
 
@@ -66,7 +68,10 @@ def _resolve_server_env() -> Dict[str, str]:
 
 
 def create_github_mcp_toolset(
-    *, timeout_seconds: float | None = None, tool_name_prefix: str | None = "GITHUB"
+    *,
+    timeout_seconds: float | None = None,
+    retry_attempts: int | None = None,
+    tool_name_prefix: str | None = "GITHUB",
 ) -> McpToolset:
     command = _resolve_command()
     args = _resolve_args()
@@ -75,13 +80,17 @@ def create_github_mcp_toolset(
     timeout = timeout_seconds if timeout_seconds is not None else float(
         os.getenv("GITHUB_MCP_TIMEOUT", "10.0")
     )
+    attempts = retry_attempts if retry_attempts is not None else int(
+        os.getenv("GITHUB_MCP_RETRY_ATTEMPTS", "3")
+    )
 
     connection_params = StdioConnectionParams(
         server_params=StdioServerParameters(command=command, args=args, env=env),
         timeout=timeout,
     )
 
-    return McpToolset(
+    return RetryingMcpToolset(
         connection_params=connection_params,
         tool_name_prefix=tool_name_prefix,
+        retry_attempts=attempts,
     )
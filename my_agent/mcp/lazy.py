@@ -0,0 +1,38 @@
+"""Toolset wrapper that creates the underlying toolset on first use."""
+
+from __future__ import annotations
+
+from typing import Callable, List, Optional
+
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.base_toolset import BaseToolset
+
+
+class LazyToolset(BaseToolset):
+    """Defer creating a toolset until an agent first asks for its tools.
+
+    Agents are defined at import time, so creating an MCP toolset there makes
+    `import my_agent` fail when the server is not configured. Configuration
+    errors are raised from the first `get_tools` call instead.
+    """
+
+    def __init__(self, factory: Callable[[], BaseToolset]):
+        super().__init__()
+        self._factory = factory
+        self._toolset: Optional[BaseToolset] = None
+
+    def _resolve(self) -> BaseToolset:
+        if self._toolset is None:
+            self._toolset = self._factory()
+        return self._toolset
+
+    async def get_tools(
+        self, readonly_context: Optional[ReadonlyContext] = None
+    ) -> List[BaseTool]:
+        # The wrapped toolset keeps its own name prefix (e.g. GITHUB_)
+        return await self._resolve().get_tools_with_prefix(readonly_context)
+
+    async def close(self) -> None:
+        if self._toolset is not None:
+            await self._toolset.close()
@@ -0,0 +1,88 @@
+"""Retries for transient failures of read-only MCP tools."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import Any, List, Optional
+
+import anyio
+import httpx
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.mcp_tool import McpToolset
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+from mcp.shared.exceptions import McpError
+
+# Only reads are retried: a timed-out write may already have been applied.
+READ_ONLY_PREFIXES = ("get_", "list_", "search_")
+
+_TRANSIENT_MESSAGE = re.compile(
+    r"rate limit|timed out|timeout|bad gateway|service unavailable|\b(?:429|502|503|504)\b",
+    re.IGNORECASE,
+)
+
+
+def _is_transient_error(error: Exception) -> bool:
+    if isinstance(error, (anyio.ClosedResourceError, anyio.BrokenResourceError)):
+        return True
+    if isinstance(error, McpError):
+        return error.error.code == httpx.codes.REQUEST_TIMEOUT or bool(
+            _TRANSIENT_MESSAGE.search(error.error.message)
+        )
+    return False
+
+
+def _is_transient_result(response: Any) -> bool:
+    if not getattr(response, "isError", False):
+        return False
+    text = " ".join(getattr(part, "text", "") for part in getattr(response, "content", []))
+    return bool(_TRANSIENT_MESSAGE.search(text))
+
+
+class RetryingMcpTool(BaseTool):
+    """Wraps an MCP tool, retrying transient failures with exponential backoff."""
+
+    def __init__(
+        self, tool: BaseTool, *, attempts: int = 3, initial_delay: float = 1.0, max_delay: float = 8.0
+    ):
+        super().__init__(
+            name=tool.name,
+            description=tool.description,
+            is_long_running=tool.is_long_running,
+            custom_metadata=tool.custom_metadata,
+        )
+        self._tool = tool
+        self._attempts = max(1, attempts)
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        return self._tool._get_declaration()
+
+    async def run_async(self, *, args: dict[str, Any], tool_context: ToolContext) -> Any:
+        attempts = self._attempts if self._tool.name.startswith(READ_ONLY_PREFIXES) else 1
+        for attempt in range(attempts):
+            is_last = attempt == attempts - 1
+            try:
+                response = await self._tool.run_async(args=args, tool_context=tool_context)
+            except Exception as error:
+                if is_last or not _is_transient_error(error):
+                    raise
+            else:
+                if is_last or not _is_transient_result(response):
+                    return response
+            await asyncio.sleep(min(self._max_delay, self._initial_delay * 2**attempt))
+
+
+class RetryingMcpToolset(McpToolset):
+    """`McpToolset` whose tools retry transient failures of read-only calls."""
+
+    def __init__(self, *, retry_attempts: int = 3, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._retry_attempts = retry_attempts
+
+    async def get_tools(self, readonly_context: Optional[ReadonlyContext] = None) -> List[BaseTool]:
+        tools = await super().get_tools(readonly_context)
+        return [RetryingMcpTool(tool, attempts=self._retry_attempts) for tool in tools]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional, Any
@@ -10,6 +12,9 @@ import yaml
 
 PROMPTS_DIR = Path(__file__).parent
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass(frozen=True)
 class Prompt:
@@ -22,7 +27,7 @@ class Prompt:
 
 def _load_prompt_from_yaml(filename: str, *, prompt_key: str = "prompt") -> Prompt:
     path = PROMPTS_DIR / filename
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = yaml.load(path.read_text(encoding="utf-8"), Loader=_SafeLoader)
     if not data or prompt_key not in data:
         raise ValueError(f"Prompt file '{filename}' missing '{prompt_key}' key.")
     name = data.get("name", Path(filename).stem)
@@ -32,10 +37,14 @@ def _load_prompt_from_yaml(filename: str, *, prompt_key: str = "prompt") -> Prom
     if isinstance(schema_raw, (dict, list)):
         schema_parsed = schema_raw
     elif isinstance(schema_raw, str) and schema_raw.strip():
+        # Schemas are written as JSON blocks; YAML covers the looser ones.
         try:
-            schema_parsed = yaml.safe_load(schema_raw)
-        except yaml.YAMLError:
-            schema_parsed = None
+            schema_parsed = json.loads(schema_raw)
+        except ValueError:
+            try:
+                schema_parsed = yaml.load(schema_raw, Loader=_SafeLoader)
+            except yaml.YAMLError:
+                schema_parsed = None
 
     return Prompt(name=name, prompt=data[prompt_key], output_format=output_format, output_schema=schema_parsed)
 
@@ -46,3 +55,20 @@ PROMPTS: Dict[str, Prompt] = {
     "senior_test_review": _load_prompt_from_yaml("senior_test_review.yaml"),
     "test_execution": _load_prompt_from_yaml("test_execution.yaml"),
 }
+
+
+def _build_instruction(prompt: Prompt) -> str:
+    if not prompt.output_format:
+        return prompt.prompt
+    return (
+        prompt.prompt
+        + "\n\nReference the output format when structuring the response:\n\n"
+        + prompt.output_format
+    )
+
+
+# Agent instructions (prompt + output format), built and interned once per
+# process so every agent referencing a prompt shares the same string.
+INSTRUCTIONS: Dict[str, str] = {
+    key: sys.intern(_build_instruction(prompt)) for key, prompt in PROMPTS.items()
+}
@@ -0,0 +1,216 @@
+"""
+Tests for the junior/senior loop in custom_agent.py
+Run: python -m pytest test_generation_loop.py -v
+Or directly: python test_generation_loop.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+try:
+    # Import only custom_agent, not the full my_agent package, so the
+    # GitHub MCP toolset and prompts are not loaded
+    import importlib.util
+
+    from google.adk.agents import BaseAgent
+    from google.adk.agents.invocation_context import InvocationContext
+    from google.adk.events import Event
+    from google.adk.sessions import InMemorySessionService
+    from google.genai import types
+
+    test_file = Path(__file__).resolve()
+    custom_agent_path = test_file.parent.parent / "custom_agent.py"  # tests -> my_agent -> custom_agent.py
+
+    spec = importlib.util.spec_from_file_location("custom_agent", custom_agent_path)
+    custom_agent = importlib.util.module_from_spec(spec)
+    sys.modules["custom_agent"] = custom_agent
+    spec.loader.exec_module(custom_agent)
+
+    GenerationRevisionAgent = custom_agent.GenerationRevisionAgent
+
+except Exception as e:
+    print(f"Error importing custom_agent: {e}")
+    print("\nEnsure google-adk is installed and you're running from project root:")
+    print("  python my_agent/tests/test_generation_loop.py")
+    sys.exit(1)
+
+
+# ============================================================================
+# Test Utilities
+# ============================================================================
+
+class Colors:
+    """ANSI color codes."""
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+
+
+def print_header(text):
+    """Print a section header."""
+    print(f"\n{Colors.BLUE}{Colors.BOLD}{'='*70}{Colors.RESET}")
+    print(f"{Colors.BLUE}{Colors.BOLD}{text}{Colors.RESET}")
+    print(f"{Colors.BLUE}{Colors.BOLD}{'='*70}{Colors.RESET}\n")
+
+
+def assert_equal(actual, expected, msg=""):
+    """Custom assertion for clarity."""
+    if actual != expected:
+        raise AssertionError(f"{msg}\nExpected: {expected}\nActual: {actual}")
+
+
+class StubAgent(BaseAgent):
+    """Sub-agent that issues a scripted list of tool calls per round.
+
+    `approve_generation` calls also write the approval marker, as the real
+    tool does, unless `write_approvals` is False.
+    """
+
+    rounds: List[List[Tuple[str, str]]] = []
+    write_approvals: bool = True
+
+    async def _run_async_impl(self, ctx):
+        calls = self.rounds.pop(0) if self.rounds else []
+        for name, service in calls:
+            if name == "approve_generation" and self.write_approvals:
+                state_dir = Path(".api-tests/.atlas-internal")
+                state_dir.mkdir(parents=True, exist_ok=True)
+                (state_dir / f"{service}.approved.json").write_text(json.dumps({"service": service}))
+        if calls:
+            yield Event(
+                author=self.name,
+                content=types.Content(
+                    role="model",
+                    parts=[
+                        types.Part(function_call=types.FunctionCall(name=name, args={"service": service}))
+                        for name, service in calls
+                    ],
+                ),
+            )
+
+
+def run_loop(senior_rounds, services=("pokemon-service", "team-service"), max_iterations=5, write_approvals=True):
+    """Run the loop in a scratch project; return (iterations, loop messages)."""
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.chdir(tmpdir)
+        try:
+            routes_dir = Path(".api-tests/routes")
+            routes_dir.mkdir(parents=True)
+            for service in services:
+                (routes_dir / f"{service}-routes.json").write_text("{}")
+
+            loop = GenerationRevisionAgent(
+                name="test_generation_loop",
+                sub_agents=[
+                    StubAgent(name="junior"),
+                    StubAgent(name="senior", rounds=list(senior_rounds), write_approvals=write_approvals),
+                ],
+                max_iterations=max_iterations,
+            )
+
+            async def collect():
+                session_service = InMemorySessionService()
+                session = await session_service.create_session(app_name="test", user_id="user")
+                ctx = InvocationContext(
+                    session_service=session_service,
+                    invocation_id="test-invocation",
+                    agent=loop,
+                    session=session,
+                )
+                return [
+                    event.content.parts[0].text
+                    async for event in loop.run_async(ctx)
+                    if event.author == loop.name
+                ]
+
+            messages = asyncio.run(collect())
+        finally:
+            os.chdir(previous_cwd)
+
+    iterations = sum(message.startswith("Test generation iteration") for message in messages)
+    return iterations, messages
+
+
+# ============================================================================
+# Generation Loop Tests
+# ============================================================================
+
+class TestGenerationLoop:
+    """Test when the junior/senior loop stops."""
+
+    @staticmethod
+    def test_01_partial_approval_keeps_iterating():
+        """Test an unreviewed service gets another round after a partial approval."""
+        iterations, messages = run_loop([
+            [("approve_generation", "pokemon-service")],
+            [("approve_generation", "team-service")],
+        ])
+
+        assert_equal(iterations, 2, "team-service should get a second round")
+        assert_equal(messages[-2], "All services approved. Stopping test generation loop.")
+
+    @staticmethod
+    def test_02_no_decisions_runs_to_max_iterations():
+        """Test a senior that decides nothing does not end the loop early."""
+        iterations, _ = run_loop([], max_iterations=3)
+
+        assert_equal(iterations, 3, "Undecided services should keep the loop going")
+
+    @staticmethod
+    def test_03_requested_changes_keep_iterating():
+        """Test requested changes lead to another round."""
+        iterations, messages = run_loop([
+            [("approve_generation", "pokemon-service"), ("request_changes", "team-service")],
+            [("approve_generation", "team-service")],
+        ])
+
+        assert_equal(iterations, 2)
+        assert_equal(messages[-2], "All services approved. Stopping test generation loop.")
+
+    @staticmethod
+    def test_04_all_decided_without_changes_stops():
+        """Test the early exit once every service is decided and none need changes."""
+        iterations, messages = run_loop(
+            [[("approve_generation", "pokemon-service"), ("approve_generation", "team-service")]],
+            write_approvals=False,
+        )
+
+        assert_equal(iterations, 1)
+        assert_equal(messages[-2], "No changes requested. Stopping test generation loop.")
+
+
+def run_tests():
+    """Run all tests."""
+    print_header("Generation Loop Test Suite")
+
+    test_methods = sorted(m for m in dir(TestGenerationLoop) if m.startswith("test_"))
+    failed_tests = 0
+
+    for method_name in test_methods:
+        test_name = method_name.replace('_', ' ').replace('test ', '').title()
+        try:
+            getattr(TestGenerationLoop, method_name)()
+            print(f"  {Colors.GREEN}✓{Colors.RESET} {test_name}")
+        except Exception as e:
+            print(f"  {Colors.RED}✗{Colors.RESET} {test_name}")
+            print(f"    {Colors.RED}{str(e)[:200]}{Colors.RESET}")
+            failed_tests += 1
+
+    print()
+    print(f"Total:  {len(test_methods)}")
+    print(f"{Colors.GREEN}Passed: {len(test_methods) - failed_tests}{Colors.RESET}")
+    print(f"{Colors.RED}Failed: {failed_tests}{Colors.RESET}\n")
+    return 1 if failed_tests else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
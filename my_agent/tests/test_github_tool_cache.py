@@ -0,0 +1,185 @@
+"""
+Tests for the GitHub tool result cache in callbacks.py
+Run: python -m pytest test_github_tool_cache.py -v
+Or directly: python test_github_tool_cache.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+try:
+    # Import only callbacks, not the full my_agent package
+    import importlib.util
+
+    test_file = Path(__file__).resolve()
+    callbacks_path = test_file.parent.parent / "callbacks.py"  # tests -> my_agent -> callbacks.py
+
+    spec = importlib.util.spec_from_file_location("callbacks", callbacks_path)
+    callbacks = importlib.util.module_from_spec(spec)
+    sys.modules["callbacks"] = callbacks
+    spec.loader.exec_module(callbacks)
+
+except Exception as e:
+    print(f"Error importing callbacks: {e}")
+    print("\nEnsure cachetools is installed and you're running from project root:")
+    print("  python my_agent/tests/test_github_tool_cache.py")
+    sys.exit(1)
+
+
+# ============================================================================
+# Test Utilities
+# ============================================================================
+
+class Colors:
+    """ANSI color codes."""
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+
+
+def print_header(text):
+    """Print a section header."""
+    print(f"\n{Colors.BLUE}{Colors.BOLD}{'='*70}{Colors.RESET}")
+    print(f"{Colors.BLUE}{Colors.BOLD}{text}{Colors.RESET}")
+    print(f"{Colors.BLUE}{Colors.BOLD}{'='*70}{Colors.RESET}\n")
+
+
+def assert_equal(actual, expected, msg=""):
+    """Custom assertion for clarity."""
+    if actual != expected:
+        raise AssertionError(f"{msg}\nExpected: {expected}\nActual: {actual}")
+
+
+TOOL = SimpleNamespace(name="GITHUB_get_file_contents")
+ARGS = {"owner": "octo", "repo": "app", "path": "routes.py"}
+
+
+async def call_tool(invocation_id, run_tool):
+    """Mirror ADK: before callback, the tool if not reused, then after callback."""
+    tool_context = SimpleNamespace(invocation_id=invocation_id)
+    response = await callbacks.reuse_github_tool_result(TOOL, dict(ARGS), tool_context)
+    if response is None:
+        response = await run_tool()
+        callbacks.store_github_tool_result(TOOL, dict(ARGS), tool_context, response)
+    return response
+
+
+def run_concurrently(invocation_id, *run_tools):
+    """Run each call in its own task, as ADK does for a turn's function calls."""
+    async def gather():
+        tasks = [asyncio.create_task(call_tool(invocation_id, run_tool)) for run_tool in run_tools]
+        return await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=5)
+
+    return asyncio.run(gather())
+
+
+# ============================================================================
+# GitHub Tool Cache Tests
+# ============================================================================
+
+class TestGithubToolCache:
+    """Test reuse of concurrent and repeated GitHub reads."""
+
+    @staticmethod
+    def test_01_concurrent_identical_calls_run_once():
+        """Test identical calls in one turn share a single tool run."""
+        runs = []
+
+        async def run_tool():
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            return {"content": "ok"}
+
+        results = run_concurrently("concurrent", run_tool, run_tool, run_tool)
+
+        assert_equal(len(runs), 1, "Only the first call should reach the tool")
+        assert_equal(results, [{"content": "ok"}] * 3)
+        assert_equal(callbacks._github_tool_inflight, {}, "In-flight entry should be cleared")
+
+    @staticmethod
+    def test_02_waiters_run_tool_when_first_call_raises():
+        """Test waiters are released and call the tool if the first call raises."""
+        runs = []
+
+        async def failing_tool():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("MCP server went away")
+
+        async def run_tool():
+            runs.append(1)
+            return {"content": "ok"}
+
+        results = run_concurrently("raises", failing_tool, run_tool, run_tool)
+
+        assert isinstance(results[0], RuntimeError)
+        assert_equal(results[1:], [{"content": "ok"}] * 2)
+        assert_equal(len(runs), 2, "Each waiter should run the tool itself")
+        assert_equal(callbacks._github_tool_inflight, {}, "In-flight entry should be cleared")
+
+    @staticmethod
+    def test_03_error_results_are_not_shared():
+        """Test an isError result is neither shared with waiters nor cached."""
+        runs = []
+
+        async def error_tool():
+            await asyncio.sleep(0.01)
+            return {"isError": True, "content": "rate limited"}
+
+        async def run_tool():
+            runs.append(1)
+            return {"content": "ok"}
+
+        results = run_concurrently("is-error", error_tool, run_tool)
+
+        assert_equal(results, [{"isError": True, "content": "rate limited"}, {"content": "ok"}])
+        assert_equal(len(runs), 1)
+
+    @staticmethod
+    def test_04_cache_is_scoped_to_invocation():
+        """Test a new invocation does not reuse another invocation's result."""
+        runs = []
+
+        async def run_tool():
+            runs.append(1)
+            return {"content": f"run {len(runs)}"}
+
+        first = run_concurrently("invocation-a", run_tool)
+        repeat = run_concurrently("invocation-a", run_tool)
+        other = run_concurrently("invocation-b", run_tool)
+
+        assert_equal(first, repeat, "Repeated call in the same invocation should be cached")
+        assert_equal(other, [{"content": "run 2"}])
+        assert_equal(len(runs), 2)
+
+
+def run_tests():
+    """Run all tests."""
+    print_header("GitHub Tool Cache Test Suite")
+
+    test_methods = sorted(m for m in dir(TestGithubToolCache) if m.startswith("test_"))
+    failed_tests = 0
+
+    for method_name in test_methods:
+        test_name = method_name.replace('_', ' ').replace('test ', '').title()
+        try:
+            getattr(TestGithubToolCache, method_name)()
+            print(f"  {Colors.GREEN}✓{Colors.RESET} {test_name}")
+        except Exception as e:
+            print(f"  {Colors.RED}✗{Colors.RESET} {test_name}")
+            print(f"    {Colors.RED}{str(e)[:200]}{Colors.RESET}")
+            failed_tests += 1
+
+    print()
+    print(f"Total:  {len(test_methods)}")
+    print(f"{Colors.GREEN}Passed: {len(test_methods) - failed_tests}{Colors.RESET}")
+    print(f"{Colors.RED}Failed: {failed_tests}{Colors.RESET}\n")
+    return 1 if failed_tests else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
@@ -0,0 +1,178 @@
+"""
+Tests for retrying transient MCP tool failures in mcp/retry.py
+Run: python -m pytest test_mcp_retry.py -v
+Or directly: python test_mcp_retry.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+try:
+    # Import only mcp/retry.py, not the full my_agent package
+    import importlib.util
+
+    from google.adk.tools.base_tool import BaseTool
+    from mcp.shared.exceptions import McpError
+    from mcp.types import CallToolResult, ErrorData, TextContent
+
+    test_file = Path(__file__).resolve()
+    retry_path = test_file.parent.parent / "mcp" / "retry.py"  # tests -> my_agent -> mcp/retry.py
+
+    spec = importlib.util.spec_from_file_location("mcp_retry", retry_path)
+    mcp_retry = importlib.util.module_from_spec(spec)
+    sys.modules["mcp_retry"] = mcp_retry
+    spec.loader.exec_module(mcp_retry)
+
+    RetryingMcpTool = mcp_retry.RetryingMcpTool
+
+except Exception as e:
+    print(f"Error importing mcp/retry.py: {e}")
+    print("\nEnsure google-adk is installed and you're running from project root:")
+    print("  python my_agent/tests/test_mcp_retry.py")
+    sys.exit(1)
+
+
+# ============================================================================
+# Test Utilities
+# ============================================================================
+
+class Colors:
+    """ANSI color codes."""
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+
+
+def print_header(text):
+    """Print a section header."""
+    print(f"\n{Colors.BLUE}{Colors.BOLD}{'='*70}{Colors.RESET}")
+    print(f"{Colors.BLUE}{Colors.BOLD}{text}{Colors.RESET}")
+    print(f"{Colors.BLUE}{Colors.BOLD}{'='*70}{Colors.RESET}\n")
+
+
+def assert_equal(actual, expected, msg=""):
+    """Custom assertion for clarity."""
+    if actual != expected:
+        raise AssertionError(f"{msg}\nExpected: {expected}\nActual: {actual}")
+
+
+def error_result(text):
+    return CallToolResult(content=[TextContent(type="text", text=text)], isError=True)
+
+
+OK = CallToolResult(content=[TextContent(type="text", text="ok")])
+TIMEOUT = McpError(ErrorData(code=408, message="Timed out while waiting for response"))
+
+
+class ScriptedTool(BaseTool):
+    """Tool returning (or raising) a scripted outcome per call."""
+
+    def __init__(self, name, outcomes):
+        super().__init__(name=name, description="scripted")
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def run_async(self, *, args, tool_context):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def run_tool(tool, attempts=3):
+    retrying = RetryingMcpTool(tool, attempts=attempts, initial_delay=0)
+    return asyncio.run(retrying.run_async(args={}, tool_context=None))
+
+
+# ============================================================================
+# Retry Tests
+# ============================================================================
+
+class TestMcpRetry:
+    """Test which MCP tool failures are retried."""
+
+    @staticmethod
+    def test_01_transient_error_result_is_retried():
+        """Test a rate-limited read is retried until it succeeds."""
+        tool = ScriptedTool("get_file_contents", [error_result("API rate limit exceeded"), OK])
+
+        assert_equal(run_tool(tool), OK)
+        assert_equal(tool.calls, 2)
+
+    @staticmethod
+    def test_02_timeout_raises_after_last_attempt():
+        """Test a read that keeps timing out raises once attempts run out."""
+        tool = ScriptedTool("search_code", [TIMEOUT, TIMEOUT, TIMEOUT])
+
+        try:
+            run_tool(tool)
+        except McpError:
+            pass
+        else:
+            raise AssertionError("Expected McpError after the last attempt")
+        assert_equal(tool.calls, 3)
+
+    @staticmethod
+    def test_03_permanent_error_is_not_retried():
+        """Test a non-transient error result is returned as is."""
+        not_found = error_result("Not Found: routes.py")
+        tool = ScriptedTool("get_file_contents", [not_found, OK])
+
+        assert_equal(run_tool(tool), not_found)
+        assert_equal(tool.calls, 1)
+
+    @staticmethod
+    def test_04_writes_are_not_retried():
+        """Test a timed-out write is not sent again."""
+        tool = ScriptedTool("create_issue", [TIMEOUT, OK])
+
+        try:
+            run_tool(tool)
+        except McpError:
+            pass
+        else:
+            raise AssertionError("Expected the write's McpError to propagate")
+        assert_equal(tool.calls, 1)
+
+    @staticmethod
+    def test_05_declaration_and_name_come_from_wrapped_tool():
+        """Test the wrapper exposes the wrapped tool's name and declaration."""
+        tool = ScriptedTool("list_commits", [])
+        tool._get_declaration = lambda: "declaration"
+        retrying = RetryingMcpTool(tool)
+
+        assert_equal(retrying.name, "list_commits")
+        assert_equal(retrying._get_declaration(), "declaration")
+
+
+def run_tests():
+    """Run all tests."""
+    print_header("MCP Retry Test Suite")
+
+    test_methods = sorted(m for m in dir(TestMcpRetry) if m.startswith("test_"))
+    failed_tests = 0
+
+    for method_name in test_methods:
+        test_name = method_name.replace('_', ' ').replace('test ', '').title()
+        try:
+            getattr(TestMcpRetry, method_name)()
+            print(f"  {Colors.GREEN}✓{Colors.RESET} {test_name}")
+        except Exception as e:
+            print(f"  {Colors.RED}✗{Colors.RESET} {test_name}")
+            print(f"    {Colors.RED}{str(e)[:200]}{Colors.RESET}")
+            failed_tests += 1
+
+    print()
+    print(f"Total:  {len(test_methods)}")
+    print(f"{Colors.GREEN}Passed: {len(test_methods) - failed_tests}{Colors.RESET}")
+    print(f"{Colors.RED}Failed: {failed_tests}{Colors.RESET}\n")
+    return 1 if failed_tests else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_tests())
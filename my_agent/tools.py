@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import re
 import shlex
 import shutil
 import subprocess
+import sys
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -61,16 +65,19 @@ def store_routes_snapshot(
 
 def list_route_snapshots() -> Dict[str, List[str]]:
     """Returns the available route snapshot filenames."""
-    ROUTES_DIR.mkdir(parents=True, exist_ok=True)
-    snapshots = sorted(
-        str(path.name) for path in ROUTES_DIR.glob("*.json") if path.is_file()
-    )
+    if not ROUTES_DIR.is_dir():
+        return {"snapshots": []}
+    with os.scandir(ROUTES_DIR) as entries:
+        snapshots = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
     return {"snapshots": snapshots}
 
 
 def load_route_snapshot(*, filename: str) -> Dict[str, Any]:
     """Loads a specific route snapshot JSON payload."""
-    ROUTES_DIR.mkdir(parents=True, exist_ok=True)
     target_path = ROUTES_DIR / filename
     if not target_path.exists():
         raise FileNotFoundError(
@@ -98,34 +105,74 @@ def store_playwright_tests(
 
 
 
+def _find_spec_files(root: Path) -> List[str]:
+    """Sorted `*.spec.ts` paths under `root`, relative to it.
+
+    Walks with `os.scandir` so each entry's type comes from the directory
+    listing instead of a separate stat per `Path`.
+    """
+    root_str = os.fspath(root)
+    prefix_len = len(os.path.join(root_str, ""))
+    specs: List[str] = []
+    stack = [root_str]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                # Like rglob, do not descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".spec.ts") and entry.is_file():
+                    specs.append(entry.path[prefix_len:])
+    specs.sort()
+    return specs
+
+
 def list_playwright_tests() -> Dict[str, List[str]]:
     """List generated Playwright spec files under `.api-tests/tests`."""
-    TESTS_DIR.mkdir(parents=True, exist_ok=True)
-    specs = sorted(
-        str(path.relative_to(TESTS_DIR))
-        for path in TESTS_DIR.rglob("*.spec.ts")
-        if path.is_file()
-    )
-    return {"specs": specs}
+    if not TESTS_DIR.is_dir():
+        return {"specs": []}
+    return {"specs": _find_spec_files(TESTS_DIR)}
 
 
 def load_playwright_test(*, filename: str) -> Dict[str, Any]:
     """Load a generated Playwright spec file from `.api-tests/tests`."""
-    TESTS_DIR.mkdir(parents=True, exist_ok=True)
     target_path = TESTS_DIR / filename
     if not target_path.exists():
         raise FileNotFoundError(f"Spec file '{filename}' not found in {TESTS_DIR}.")
     return {"filename": filename, "code": target_path.read_text(encoding="utf-8")}
 
 
-def run_playwright_tests() -> Dict[str, Any]:
+async def run_playwright_tests() -> Dict[str, Any]:
     """Execute `npx playwright test` for the generated specs."""
+    # A run can take minutes; keep it off the event loop so ADK keeps
+    # streaming events while Playwright works.
+    return await asyncio.to_thread(_run_playwright_tests_sync)
+
+
+# Project roots found so far, keyed by working directory. Misses are not
+# cached so a `package.json` created later in the session is still found.
+_project_roots: Dict[str, Path] = {}
 
-    base_dir = Path.cwd()
-    for parent in [base_dir] + list(base_dir.parents):
-        if (parent / "package.json").exists():
-            base_dir = parent
-            break
+
+def _find_project_root() -> Path:
+    """Nearest directory (cwd or an ancestor) holding `package.json`, else cwd."""
+    cwd = os.getcwd()
+    cached = _project_roots.get(cwd)
+    if cached is not None:
+        return cached
+    current = cwd
+    while True:
+        if os.path.exists(os.path.join(current, "package.json")):
+            root = _project_roots[cwd] = Path(current)
+            return root
+        parent = os.path.dirname(current)
+        if parent == current:
+            return Path(cwd)
+        current = parent
+
+
+def _run_playwright_tests_sync() -> Dict[str, Any]:
+    base_dir = _find_project_root()
 
     spec_root = base_dir / ".api-tests" / "tests"
     if not spec_root.exists():
@@ -135,18 +182,57 @@ def run_playwright_tests() -> Dict[str, Any]:
             "spec_directory": str(spec_root),
         }
 
-    spec_files = sorted(
-        str(path.relative_to(spec_root)) for path in spec_root.rglob("*.spec.ts") if path.is_file()
-    )
+    spec_files = _find_spec_files(spec_root)
 
     local_bin = base_dir / "node_modules" / ".bin"
     playwright_bin = local_bin / ("playwright.cmd" if os.name == "nt" else "playwright")
     config_path = base_dir / "playwright.config.ts"
 
+    # Executables are resolved to full paths so no shell is needed; on Windows
+    # this also finds npx.cmd through PATHEXT.
     if playwright_bin.exists():
         command: List[str] = [str(playwright_bin), "test", "--config", str(config_path)]
     else:
-        command = ["npx", "playwright", "test", "--config", str(config_path)]
+        npx = shutil.which("npx") or "npx"
+        command = [npx, "playwright", "test", "--config", str(config_path)]
+
+    # Optional overrides of playwright.config.ts parallelism. Fully parallel
+    # mode splits tests within a spec across workers, so it is opt-in: specs
+    # whose tests share state (create -> fetch -> delete) must stay serial.
+    workers = os.getenv("PLAYWRIGHT_WORKERS")
+    if workers:
+        command += ["--workers", workers]
+    if os.getenv("PLAYWRIGHT_FULLY_PARALLEL") == "1":
+        command.append("--fully-parallel")
+
+    # CI fan-out: each job runs one slice of the specs, e.g. PLAYWRIGHT_SHARD=2/4
+    shard = os.getenv("PLAYWRIGHT_SHARD")
+    if shard:
+        match = re.fullmatch(r"(\d+)/(\d+)", shard)
+        if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+            return {
+                "status": "error",
+                "error": f"PLAYWRIGHT_SHARD must look like 'index/total' (e.g. 2/4), got '{shard}'.",
+                "spec_directory": str(spec_root),
+            }
+        command.append(f"--shard={shard}")
+
+    # Only the tail of the output is returned to the agent; the summary and
+    # failures come last and full details live in the HTML/JSON reports.
+    max_output_raw = os.getenv("PLAYWRIGHT_STDOUT_MAX_BYTES", "").strip()
+    if not max_output_raw:
+        max_output = 256 * 1024
+    elif re.fullmatch(r"\d+", max_output_raw):
+        max_output = int(max_output_raw)
+    else:
+        return {
+            "status": "error",
+            "error": (
+                "PLAYWRIGHT_STDOUT_MAX_BYTES must be a whole number of bytes "
+                f"(0 keeps everything), got '{max_output_raw}'."
+            ),
+            "spec_directory": str(spec_root),
+        }
 
     env = os.environ.copy()
     env["PATH"] = os.pathsep.join([str(local_bin), env.get("PATH", "")])
@@ -159,15 +245,27 @@ def run_playwright_tests() -> Dict[str, Any]:
             env=env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            shell=(os.name == "nt"),
         )
 
-        stdout_lines: List[str] = []
+        # Drain raw chunks rather than decoding line by line. A blocking read
+        # returns as soon as any output is available, so progress still streams.
+        output = bytearray()
+        dropped = 0
         assert process.stdout is not None
-        for line in process.stdout:
-            print(line, end="")
-            stdout_lines.append(line)
+        fd = process.stdout.fileno()
+        echo = getattr(sys.stdout, "buffer", None)
+        sys.stdout.flush()  # keep earlier text output ahead of the raw bytes
+        while chunk := os.read(fd, 65536):
+            output += chunk
+            if max_output > 0 and len(output) > 2 * max_output:
+                excess = len(output) - max_output
+                del output[:excess]
+                dropped += excess
+            if echo is not None:
+                echo.write(chunk)
+                echo.flush()
+            else:
+                print(chunk.decode("utf-8", "replace"), end="")
 
         exit_code = process.wait()
     except FileNotFoundError as exc:
@@ -182,7 +280,18 @@ def run_playwright_tests() -> Dict[str, Any]:
         }
 
     duration = time.time() - start_time
-    stdout_text = "".join(stdout_lines)
+    if max_output > 0 and len(output) > max_output:
+        dropped += len(output) - max_output
+        del output[: len(output) - max_output]
+    if dropped:
+        # Start at a line boundary rather than mid-line (or mid-character).
+        newline = output.find(b"\n")
+        if newline != -1:
+            dropped += newline + 1
+            del output[: newline + 1]
+    stdout_text = output.decode("utf-8", "replace").replace("\r\n", "\n")
+    if dropped:
+        stdout_text = f"[truncated {dropped} bytes of earlier output]\n" + stdout_text
 
     return {
         "status": "success" if exit_code == 0 else "failure",
@@ -193,19 +302,38 @@ def run_playwright_tests() -> Dict[str, Any]:
         "report_path": str(base_dir / "playwright-report" / "index.html"),
         "spec_directory": str(spec_root),
         "spec_files": spec_files,
+        "shard": shard,
     }
-def crawl_routes_snapshot(
+async def crawl_routes_snapshot(
     *,
     repo: str,
     files_dict: Dict[str, str],  # {file_path: content}
     commit: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Extract routes efficiently and store snapshot."""
-    routes, metadata = extract_routes_parallel(
-        files=files_dict,
-        use_cache=True,
-        max_workers=4,
+    # Parsing a large repo is CPU-bound; run it in a thread like the
+    # Playwright runner so the event loop is not blocked meanwhile.
+    return await asyncio.to_thread(
+        _crawl_routes_snapshot_sync, repo=repo, files_dict=files_dict, commit=commit
     )
+
+
+# Crawls share the on-disk route cache, so they still run one at a time.
+_crawl_lock = threading.Lock()
+
+
+def _crawl_routes_snapshot_sync(
+    *,
+    repo: str,
+    files_dict: Dict[str, str],
+    commit: Optional[str] = None,
+) -> Dict[str, Any]:
+    with _crawl_lock:
+        routes, metadata = extract_routes_parallel(
+            files=files_dict,
+            use_cache=True,
+            max_workers=4,
+        )
     
     payload = {
         "repo": repo,
@@ -216,7 +344,8 @@ def crawl_routes_snapshot(
     
     # Store using existing store_routes_snapshot
     output_path = Path('.api-tests') / '.route-cache' / f"{repo.replace('/', '_')}-routes.json"
-    output_path.write_text(json.dumps(payload, indent=2))
+    # Internal cache file, so compact; routes.json stays indented for people.
+    output_path.write_text(json.dumps(payload, separators=(",", ":")))
     
     return {
         "status": "success",